@@ -1,8 +1,97 @@
 import pandas as pd
 import numpy as np
 import datetime as dt
+import os
 import re
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Patterns shared by the cleaning methods, compiled once at import time.
+_ID_PATTERN = re.compile(r'^[A-Z0-9][A-Za-z0-9]{9}$')
+_WORDED_DATE_PATTERN = re.compile(r'^(\d{4})[ -](\w+)[ -](\w+)$')
+_WEIGHT_PATTERN = re.compile(r'^([\d.]+)\s*(\w+)')
+_TIME_PATTERN = re.compile(r'\d{2}:\d{2}:\d{2}')
+_PHONE_EXT_PATTERN = re.compile(r'x.*')
+_CARD_NUMBER_PATTERN = re.compile(r'\d{12,19}')
+_DIGITS_PATTERN = re.compile(r'(\d+)')
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _id_match_kernel(codes, lengths):
+        # Hand-coded check for the _ID_PATTERN regex: exactly 10 characters,
+        # the first an uppercase letter or digit, the rest alphanumeric.
+        # Rows are independent, so prange splits them across cores with the
+        # GIL released.
+        matches = np.zeros(codes.shape[0], dtype=np.bool_)
+        for i in prange(codes.shape[0]):
+            if lengths[i] != 10:
+                continue
+            first = codes[i, 0]
+            if not (48 <= first <= 57 or 65 <= first <= 90):
+                continue
+            valid = True
+            for j in range(1, 10):
+                char = codes[i, j]
+                if not (48 <= char <= 57 or 65 <= char <= 90 or 97 <= char <= 122):
+                    valid = False
+                    break
+            matches[i] = valid
+        return matches
+else:
+    _id_match_kernel = None
+
+
+def _invalid_id_mask(column):
+    """
+    Return a boolean mask marking values that match the invalid-ID pattern.
+
+    Uses a compiled Numba kernel over fixed-width character codes when numba
+    is installed, otherwise falls back to the vectorized pandas regex match.
+
+    Parameters:
+    column (pandas.Series): The column to scan.
+
+    Returns:
+    pandas.Series: True for values matching the invalid-ID pattern.
+    """
+    if _id_match_kernel is not None:
+        values = column.astype(str)
+        codes = values.to_numpy(dtype='U10').view(np.uint32).reshape(len(values), 10)
+        lengths = values.str.len().to_numpy(dtype=np.int64)
+        return pd.Series(_id_match_kernel(codes, lengths), index=column.index)
+    if pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+        # Text columns can be matched in place; missing values cannot be IDs.
+        return column.str.match(_ID_PATTERN, na=False)
+    return column.astype(str).str.match(_ID_PATTERN)
+
+
+def _parse_dates(date_column):
+    """
+    Parse a date column to datetime64, coercing unparseable values to NaT.
+
+    A single coerced pd.to_datetime pass stands in for any per-row
+    validation: invalid rows simply come back as NaT for callers to drop.
+
+    Parameters:
+    date_column (pandas.Series): The date column to parse.
+
+    Returns:
+    pandas.Series: The parsed datetime64 column.
+    """
+    return pd.to_datetime(date_column, format='mixed', errors='coerce')
+
+
 class DataCleaning:
     """
     A class for cleaning and preprocessing data within a DataFrame.
@@ -13,6 +102,9 @@ class DataCleaning:
         data (pandas.DataFrame): The input DataFrame to be cleaned and processed.
 
     Methods:
+        _convert_worded_dates(self, date_column: pandas.Series) -> pandas.Series:
+            Convert worded dates (e.g. '1968 October 16') to 'YYYY-Month-DD' format in one vectorized pass.
+
         _clean_user_data(self) -> pandas.DataFrame:
             Clean user data within the DataFrame. Replace "NULL" values, convert dates, clean phone numbers, and more.
 
@@ -39,16 +131,94 @@ class DataCleaning:
 
     """
     
-    def __init__(self, data):
+    def __init__(self, data, engine='pandas', npartitions=None):
         """
         Initialise the DataCleaning class with a DataFrame.
 
         Parameters:
         data (pandas.DataFrame): The input DataFrame to be cleaned.
+        engine (str): 'pandas' to clean in-process, or 'dask' to split the
+            frame into partitions and clean them in parallel (requires dask).
+        npartitions (int): Number of Dask partitions; defaults to the CPU count.
         """
         self.data = data
-    
-    
+        self.engine = engine
+        self.npartitions = npartitions
+        self._id_mask_cache = {}
+        self._id_mask_frame = None
+
+        # With pyarrow installed, hold text columns as Arrow-backed strings so
+        # the str.match/str.replace/str.extract calls below run on contiguous
+        # buffers instead of boxed Python strings.
+        if _HAS_PYARROW and isinstance(data, pd.DataFrame):
+            text_columns = [column for column in data.columns
+                            if pd.api.types.is_object_dtype(data[column])
+                            or pd.api.types.is_string_dtype(data[column])]
+            if text_columns:
+                self.data = data.astype({column: 'string[pyarrow]' for column in text_columns})
+
+
+    def _id_mask(self, column_name):
+        """
+        Return the invalid-ID mask for a column, memoised per DataFrame.
+
+        Cleaning stages that run back-to-back on the same frame reuse the
+        cached mask instead of rescanning the column; the cache is cleared
+        automatically whenever self.data has been reassigned.
+
+        Parameters:
+        column_name (str): Name of the column to scan.
+
+        Returns:
+        pandas.Series: True for values matching the invalid-ID pattern.
+        """
+        if self._id_mask_frame is not self.data:
+            self._id_mask_cache.clear()
+            self._id_mask_frame = self.data
+        if column_name not in self._id_mask_cache:
+            self._id_mask_cache[column_name] = _invalid_id_mask(self.data[column_name])
+        return self._id_mask_cache[column_name]
+
+
+    def _clean_partitioned(self, partition_func):
+        """
+        Run a cleaning function over Dask partitions of the DataFrame.
+
+        The row filters and column rewrites in this class are all row-local,
+        so each partition can be cleaned independently and in parallel.
+
+        Parameters:
+        partition_func (callable): Module-level function cleaning one partition.
+
+        Returns:
+        pandas.DataFrame: The cleaned, recombined DataFrame.
+        """
+        import dask.dataframe as dd
+
+        npartitions = self.npartitions or os.cpu_count()
+        dask_data = dd.from_pandas(self.data, npartitions=npartitions)
+        self.data = dask_data.map_partitions(partition_func).compute()
+        return self.data
+
+
+    def _convert_worded_dates(self, date_column):
+        """
+        Convert worded dates (e.g. '1968 October 16') to 'YYYY-Month-DD' format.
+
+        Uses a single vectorized backreference replace over the whole column;
+        values that do not match the worded pattern pass through untouched.
+
+        Parameters:
+        date_column (pandas.Series): The date column to normalise.
+
+        Returns:
+        pandas.Series: The column with worded dates rejoined by hyphens.
+        """
+        if not (pd.api.types.is_object_dtype(date_column) or pd.api.types.is_string_dtype(date_column)):
+            date_column = date_column.astype('string')
+        return date_column.str.replace(_WORDED_DATE_PATTERN, r'\1-\2-\3', regex=True)
+
+
     def _clean_user_data(self):
         """
         Clean user data in the DataFrame.
@@ -61,44 +231,29 @@ class DataCleaning:
         Returns:
         pandas.DataFrame: The cleaned DataFrame.
         """
-        self.data['user_uuid'] = self.data['user_uuid'].replace("NULL", np.nan)
-        self.data.dropna(subset=['user_uuid'], inplace=True)
-
-
-        def convert_worded_date(worded_date):
-        # Check if the date matches the format 'YYYY Month DD' or 'Month YYYY DD'.
-            match = re.match(r'(\d{4})-(\w+)-(\d{2})|(\d{4})-(\d{2})-(\w+)', worded_date)
-    
-            if match:
-                year = match.group(1) or match.group(4)
-                month = match.group(2) or match.group(3)
-                day = match.group(3) or match.group(6)
-                return f"{year}-{month}-{day}"
-            else:
-                return worded_date
-
-        self.data['join_date'] = self.data['join_date'].apply(convert_worded_date)
-        self.data['date_of_birth'] = self.data['date_of_birth'].apply(convert_worded_date)
+        if self.engine == 'dask':
+            return self._clean_partitioned(_clean_user_partition)
 
-        pattern = r'^[A-Z0-9][A-Za-z0-9]{9}$'
- 
-        def contains_pattern(row):
-            if re.search(pattern, str(row['user_uuid'])):
-                    return True
-            return False
+        user_uuids = self.data['user_uuid']
+        self.data = self.data[user_uuids.notna() & (user_uuids != "NULL")]
 
-        self.data = self.data[~self.data.apply(contains_pattern, axis=1)]
 
-        def clean_phone_number(phone_num):
-        # Remove 'x' and anything after it, and remove the '.'.
-            phone_num = re.sub(r'x.*', '', phone_num)
-            phone_num = phone_num.replace('.', '-')
+        # Keep the parsed datetime64 columns; serialising back to strings here
+        # would only be undone again by the database layer.
+        self.data['join_date'] = _parse_dates(self._convert_worded_dates(self.data['join_date']))
+        self.data['date_of_birth'] = _parse_dates(self._convert_worded_dates(self.data['date_of_birth']))
 
-            return phone_num
+        mask = self._id_mask('user_uuid')
+        self.data = self.data[~mask]
 
-        self.data.loc[:, 'phone_number'] = self.data['phone_number'].apply(clean_phone_number)
+        # Remove 'x' and anything after it, and replace the '.' separators.
+        self.data['phone_number'] = (
+            self.data['phone_number']
+            .str.replace(_PHONE_EXT_PATTERN, '', regex=True)
+            .str.replace('.', '-', regex=False)
+        )
 
-        self.data.loc[:, 'address'] = self.data['address'].str.replace('\n', ' ')
+        self.data['address'] = self.data['address'].str.replace('\n', ' ', regex=False)
 
         return self.data
     
@@ -114,36 +269,27 @@ class DataCleaning:
         Returns:
         pandas.DataFrame: The cleaned DataFrame.
         """
-        self.data['expiry_date'] = self.data['expiry_date'].replace("NULL", np.nan)
-        self.data.dropna(inplace=True)
+        if self.engine == 'dask':
+            return self._clean_partitioned(_clean_card_partition)
+
+        self.data = self.data[self.data['expiry_date'] != "NULL"].dropna()
+
+        self.data['date_payment_confirmed'] = self._convert_worded_dates(self.data['date_payment_confirmed'])
+
+        # Parse payment dates once, dropping unparseable rows and keeping the
+        # datetime64 column rather than strings the DB layer would re-parse.
+        payment_dates = _parse_dates(self.data['date_payment_confirmed'])
+        self.data = self.data[payment_dates.notna()]
+        self.data['date_payment_confirmed'] = payment_dates.dropna()
+
+        mask = self._id_mask('expiry_date')
+        self.data = self.data[~mask]
 
-        def convert_worded_date(worded_date):
-            match = re.match(r'(\d{4})-(\w+)-(\d{2})|(\d{4})-(\d{2})-(\w+)', worded_date)
-    
-            if match:
-                year = match.group(1) or match.group(4)
-                month = match.group(2) or match.group(3)
-                day = match.group(3) or match.group(6)
-                return f"{year}-{month}-{day}"
-            else:
-                return worded_date
-
-        self.data['date_payment_confirmed'] = self.data['date_payment_confirmed'].apply(convert_worded_date)
-
-        pattern = r'^[A-Z0-9][A-Za-z0-9]{9}$'
- 
-        def contains_pattern(row):
-            if re.search(pattern, str(row['expiry_date'])):
-                    return True
-            return False
-
-        self.data = self.data[~self.data.apply(contains_pattern, axis=1)]
-
-        def clean_card_number(card_num):
         # Remove commas from the card number.
-            return re.sub(',', '', str(card_num))
+        self.data['card_number'] = self.data['card_number'].astype('string').str.replace(',', '', regex=False)
 
-        self.data['card_number'] = self.data['card_number'].apply(clean_card_number)
+        # Keep only rows whose card number is 12-19 digits, validated in one vectorized pass.
+        self.data = self.data[self.data['card_number'].str.fullmatch(_CARD_NUMBER_PATTERN, na=False)]
 
         return self.data
     
@@ -152,33 +298,41 @@ class DataCleaning:
         """
         Clean store data in the DataFrame.
 
-        - Overwrites 'lat' column with 'latitude' values.
-        - Drops the original 'latitude' column.
+        - Coalesces the spare 'lat' column into 'latitude' and drops it.
         - Cleans the address and 'continent' columns.
 
         Returns:
         pandas.DataFrame: The cleaned DataFrame.
         """
-        self.data['lat'] = self.data['latitude']
-
-        self.data.drop(columns=['latitude'], inplace=True)
+        if self.engine == 'dask':
+            return self._clean_partitioned(_clean_store_partition)
 
-        self.data.rename(columns={'lat': 'latitude'}, inplace=True)
+        # Coalesce the two latitude columns in one pass: keep 'latitude' and
+        # fall back to the mostly-empty 'lat' where it is missing.
+        self.data['latitude'] = self.data['latitude'].fillna(self.data['lat'])
+        self.data = self.data.drop(columns=['lat'])
 
-        pattern = r'^[A-Z0-9][A-Za-z0-9]{9}$'
+        mask = self._id_mask('country_code')
+        self.data = self.data[~mask]
 
-        def contains_pattern(row):
-            if re.search(pattern, str(row['country_code'])):
-                    return True
-            return False
+        # Parse opening dates once, dropping unparseable rows and keeping the
+        # datetime64 column rather than strings the DB layer would re-parse.
+        opening_dates = _parse_dates(self.data['opening_date'])
+        self.data = self.data[opening_dates.notna()]
+        self.data['opening_date'] = opening_dates.dropna()
 
-        self.data = self.data[~self.data.apply(contains_pattern, axis=1)]
+        # Fix the address newlines and continent 'ee' typos in one frame-level
+        # pass instead of a separate str.replace per column.
+        self.data = self.data.replace({'address': {r'\n': ' '}, 'continent': {'ee': ''}}, regex=True)
 
-        self.data.loc[:, 'address'] = self.data['address'].str.replace('\n', ' ')
-
-        self.data.loc[:, 'continent'] = self.data['continent'].str.replace('ee', '')
+        # 'continent' holds a handful of unique values; keep it categorical.
+        self.data['continent'] = self.data['continent'].astype('category')
         
-        self.data['staff_numbers'] = self.data['staff_numbers'].str.replace(r'[^0-9]', '')
+        # The old str.replace call was missing regex=True, making it a no-op.
+        # Extract the digits and store a compact integer column instead.
+        self.data['staff_numbers'] = pd.to_numeric(
+            self.data['staff_numbers'].str.extract(_DIGITS_PATTERN)[0], downcast='integer'
+        )
 
         return self.data
     
@@ -193,29 +347,17 @@ class DataCleaning:
         Returns:
         pandas.DataFrame: The DataFrame with weights converted to kilograms.
         """
-        converted_weights_df = products_df.copy()
-
-        def convert_to_kg(weight_str):
-            # Extract numeric value and unit (e.g. "100 ml" -> ("100", "ml")).
-            match = re.match(r"([\d.]+)\s*(\w+)", str(weight_str))
-            if match:
-                value, unit = match.groups()
-                value = float(value)
-
-                if unit == "g":
-                    result = value / 1000 
-                elif unit == "ml":
-                    result = value / 1000 
-                else:
-                    result = value
-
-                return round(result, 4)
-
-            return None 
-
-        converted_weights_df['weight'] = converted_weights_df['weight'].apply(convert_to_kg)
-
-        return converted_weights_df
+        # Extract numeric value and unit (e.g. "100 ml" -> ("100", "ml")) in one pass.
+        weights = products_df['weight']
+        if not (pd.api.types.is_object_dtype(weights) or pd.api.types.is_string_dtype(weights)):
+            weights = weights.astype('string')
+        parts = weights.str.extract(_WEIGHT_PATTERN)
+        values = pd.to_numeric(parts[0], errors='coerce')
+        in_grams_or_ml = parts[1].isin(['g', 'ml'])
+
+        # assign() replaces only the weight column; the other columns share
+        # their buffers with the input frame instead of being copied.
+        return products_df.assign(weight=np.round(np.where(in_grams_or_ml, values / 1000, values), 4))
     
     def _clean_products_data(self):
         """
@@ -228,32 +370,23 @@ class DataCleaning:
         Returns:
         pandas.DataFrame: The cleaned DataFrame.
         """
-        self.data.rename(columns={self.data.columns[0]: 'index'}, inplace=True)
-
-        self.data['product_code'] = self.data['product_code'].replace("NULL", np.nan)
-        self.data.dropna(inplace=True)
+        if self.engine == 'dask':
+            return self._clean_partitioned(_clean_products_partition)
 
-        def convert_worded_date(worded_date):
-            match = re.match(r'(\d{4})-(\w+)-(\d{2})|(\d{4})-(\d{2})-(\w+)', worded_date)
-    
-            if match:
-                year = match.group(1) or match.group(4)
-                month = match.group(2) or match.group(3)
-                day = match.group(3) or match.group(6)
-                return f"{year}-{month}-{day}"
-            else:
-                return worded_date
+        self.data.rename(columns={self.data.columns[0]: 'index'}, inplace=True)
 
-        self.data['date_added'] = self.data['date_added'].apply(convert_worded_date)
+        self.data = self.data[self.data['product_code'] != "NULL"].dropna()
 
-        pattern = r'^[A-Z0-9][A-Za-z0-9]{9}$'
+        self.data['date_added'] = self._convert_worded_dates(self.data['date_added'])
 
-        def contains_pattern(row):
-            if re.search(pattern, str(row['uuid'])):
-                    return True
-            return False
+        # Parse added dates once, dropping unparseable rows and keeping the
+        # datetime64 column rather than strings the DB layer would re-parse.
+        added_dates = _parse_dates(self.data['date_added'])
+        self.data = self.data[added_dates.notna()]
+        self.data['date_added'] = added_dates.dropna()
 
-        self.data = self.data[~self.data.apply(contains_pattern, axis=1)]
+        mask = self._id_mask('uuid')
+        self.data = self.data[~mask]
 
         return self.data
     
@@ -269,19 +402,19 @@ class DataCleaning:
         Returns:
         pandas.DataFrame: The cleaned DataFrame.
         """
+        if self.engine == 'dask':
+            return self._clean_partitioned(_clean_orders_partition)
+
         columns_to_remove = ['first_name', 'last_name', '1']
         self.data = self.data.drop(columns=columns_to_remove, errors='ignore')
 
-        self.data['card_number'] = self.data['card_number'].astype(str).str.replace(',', '', regex=True)
+        self.data['card_number'] = self.data['card_number'].astype('string').str.replace(',', '', regex=False)
 
-        pattern = r'^[A-Z0-9][A-Za-z0-9]{9}$'
+        # Keep only rows whose card number is 12-19 digits, validated in one vectorized pass.
+        self.data = self.data[self.data['card_number'].str.fullmatch(_CARD_NUMBER_PATTERN, na=False)]
 
-        def contains_pattern(row):
-            if re.search(pattern, str(row['date_uuid'])):
-                    return True
-            return False
-
-        self.data = self.data[~self.data.apply(contains_pattern, axis=1)]
+        mask = self._id_mask('date_uuid')
+        self.data = self.data[~mask]
 
         return self.data
 
@@ -299,30 +432,60 @@ class DataCleaning:
         Returns:
         pandas.DataFrame: The cleaned DataFrame.
         """
-        self.data.replace("NULL", np.nan, inplace=True)
-        self.data.dropna(inplace=True)
-
-        pattern = r'^[A-Z0-9][A-Za-z0-9]{9}$'
+        if self.engine == 'dask':
+            return self._clean_partitioned(_clean_date_events_partition)
 
-        def contains_pattern(row):
-            for value in row:
-               if re.search(pattern, str(value)):
-                   return True
-            return False
+        self.data = self.data[~(self.data == "NULL").any(axis=1)].dropna()
 
-        self.data = self.data[~self.data.apply(contains_pattern, axis=1)]
+        # Numeric columns cannot contain the ID pattern, so only scan text columns.
+        text_columns = self.data.select_dtypes(exclude='number')
+        mask = pd.concat([self._id_mask(column_name) for column_name in text_columns.columns], axis=1).any(axis=1)
+        self.data = self.data[~mask]
 
-        self.data['timestamp'] = pd.to_datetime(self.data['timestamp'], format='%H:%M:%S', errors='coerce')
-        self.data['timestamp'] = self.data['timestamp'].dt.time
+        # Validate 'HH:MM:SS' timestamps with one vectorized match and keep the
+        # compact string form rather than boxing per-row datetime.time objects.
+        self.data = self.data[self.data['timestamp'].str.fullmatch(_TIME_PATTERN)]
 
-        valid_months = list(range(1, 13)) 
-        self.data = self.data[self.data['month'].str.strip().astype(int).isin(valid_months)]
-        self.data = self.data[self.data['year'].str.isnumeric()]
-        self.data = self.data[self.data['day'].str.isnumeric()]
-        self.data = self.data[self.data['day'].astype(int).between(1, 31, inclusive='both')]
- 
-        earliest_year = 1900  
+        earliest_year = 1900
         current_year = dt.datetime.now().year
-        self.data = self.data[self.data['year'].astype(int).between(earliest_year, current_year, inclusive='both')]
 
-        return self.data
\ No newline at end of file
+        # Validate month, day and year with one combined mask and a single slice
+        # instead of rebuilding the DataFrame once per condition.
+        # to_numeric with errors='coerce' turns non-numeric rows into NaN,
+        # which fail the range checks, so no separate isnumeric passes needed.
+        months = pd.to_numeric(self.data['month'].str.strip(), errors='coerce')
+        days = pd.to_numeric(self.data['day'], errors='coerce')
+        years = pd.to_numeric(self.data['year'], errors='coerce')
+        mask = (
+            months.between(1, 12, inclusive='both')
+            & days.between(1, 31, inclusive='both')
+            & years.between(earliest_year, current_year, inclusive='both')
+        )
+        self.data = self.data[mask]
+
+        return self.data
+
+# Module-level wrappers so Dask can pickle and ship them to workers; each
+# cleans one pandas partition with the default in-process engine.
+def _clean_user_partition(partition):
+    return DataCleaning(partition)._clean_user_data()
+
+
+def _clean_card_partition(partition):
+    return DataCleaning(partition)._clean_card_data()
+
+
+def _clean_store_partition(partition):
+    return DataCleaning(partition)._clean_store_data()
+
+
+def _clean_products_partition(partition):
+    return DataCleaning(partition)._clean_products_data()
+
+
+def _clean_orders_partition(partition):
+    return DataCleaning(partition)._clean_orders_data()
+
+
+def _clean_date_events_partition(partition):
+    return DataCleaning(partition)._clean_date_events_data()
@@ -1,12 +1,36 @@
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy import create_engine, inspect, text
 from database_utils import DataBaseConnector
-from io import StringIO
 import pandas as pd
 import numpy as np
-import requests 
+import requests
+from requests.adapters import HTTPAdapter, Retry
 import tabula
 import boto3
-import json
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+log = logging.getLogger(__name__)
+
+
+def _parse_json(response):
+    """Decode a JSON response body, preferring orjson's native parser."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 
@@ -30,20 +54,41 @@ class DataExtractor:
         _list_number_of_stores(self, endpoint, headers):
             Retrieve the number of stores from a web service.
 
+        _fetch_store_record(self, base_endpoint, headers, store_number):
+            Fetch a single store's record from the web service.
+
         _retrieve_stores_data(self, base_endpoint, headers, total_stores=451):
             Retrieve data for multiple stores from a web service and return it as a Pandas DataFrame.
 
+        _fetch_s3_object(self, s3, s3_bucket, s3_object):
+            Fetch an S3 object's payload, downloading large objects in parallel byte ranges.
+
         _extract_csv_from_s3(self, s3_address):
             Extract data from a CSV file on Amazon S3 and return it as a Pandas DataFrame.
 
         _extract_json_from_s3(self, s3_address):
             Extract data from a JSON file on Amazon S3 and return it as a Pandas DataFrame.
-    """ 
+    """
     TOTAL_STORES = 451
+    # S3 range-GET window; objects larger than one window download in parallel.
+    S3_RANGE_WINDOW = 16 * 1024 * 1024
 
     def __init__(self, db_engine):
         self.engine = db_engine
 
+        # One pooled session so the 450+ store requests reuse TCP/TLS
+        # connections instead of paying a fresh handshake per call.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Client construction parses botocore's service model and resolves the
+        # credential chain; pay that once and reuse the client (the low-level
+        # client is thread-safe, so the ranged downloads can share it).
+        self._s3 = boto3.client('s3')
+
     
     def _list_db_tables(self):
         """
@@ -57,23 +102,45 @@ class DataExtractor:
         return table_names
     
     
-    def _read_rds_table(self, table_name):
+    def _read_rds_table(self, table_name, where=None):
         """
         Read data from the specified RDS database table and return it as a Pandas DataFrame.
 
         Args:
             table_name (str): Name of the database table to read.
+            where (str): Optional SQL predicate appended as a WHERE clause so
+                rows the cleaners would discard anyway are filtered server-side
+                and never cross the network.
 
         Returns:
             Pandas DataFrame containing the data from the table.
         """
         try:
-            query = text(f'SELECT * FROM {table_name}')
-            with self.engine.connect() as connection:
-                result = connection.execute(query)
-                data = result.fetchall()
-            table_df = pd.DataFrame(data)
-            return table_df
+            # Quote the table name through the dialect so reserved words and
+            # mixed-case names survive, rather than splicing it in raw.
+            quoted_table = self.engine.dialect.identifier_preparer.quote(table_name)
+            statement = f'SELECT * FROM {quoted_table}'
+            if where:
+                statement += f' WHERE {where}'
+            query = text(statement)
+            # read_sql_query fills typed column buffers straight from the DBAPI
+            # cursor, avoiding the fetchall() list-of-rows intermediate. With
+            # pyarrow installed, land the result in Arrow-backed dtypes so the
+            # string-heavy cleaning stages skip their own conversion pass.
+            # Reading in chunks keeps peak memory at one chunk plus the result
+            # instead of two full copies of the table.
+            read_kwargs = {'chunksize': 100_000}
+            if _HAS_PYARROW:
+                read_kwargs['dtype_backend'] = 'pyarrow'
+            # stream_results puts Postgres on a server-side cursor, so the
+            # driver buffers one fetch batch at a time instead of the whole
+            # result set; dialects without the option simply ignore it.
+            streaming_engine = self.engine.execution_options(stream_results=True)
+            chunks = list(pd.read_sql_query(query, streaming_engine, **read_kwargs))
+            if not chunks:
+                return pd.DataFrame()
+            # Single-chunk short-circuit: skip the concat copy entirely.
+            return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
         except Exception as e:
             print(f'Error reading RDS table {table_name}: {str(e)}')
             return pd.DataFrame()
@@ -90,12 +157,15 @@ class DataExtractor:
             Pandas DataFrame containing the extracted data.
         """
         try:
-            pdf_data = tabula.read_pdf(pdf_path, pages='all', stream=False)
-            if pdf_data:
-                combined_df = pd.concat(pdf_data)
-                return combined_df
-            else:
+            # multiple_tables=False has tabula merge the page tables itself, so
+            # one frame comes back instead of hundreds to concatenate here.
+            pdf_data = tabula.read_pdf(pdf_path, pages='all', lattice=True, multiple_tables=False)
+            if isinstance(pdf_data, pd.DataFrame):
+                return pdf_data
+            if not pdf_data:
                 return pd.DataFrame()
+            # A one-table list needs no concat; skip the copy it would make.
+            return pdf_data[0] if len(pdf_data) == 1 else pd.concat(pdf_data, ignore_index=True)
         except Exception as e:
             print(f'Error retrieving PDF data: {str(e)}')
             return pd.DataFrame()
@@ -113,9 +183,9 @@ class DataExtractor:
             The number of stores if available, or None if the request is unsuccessful or data is not found.
         """
         try:
-            response = requests.get(endpoint, headers=headers)
+            response = self._session.get(endpoint, headers=headers, timeout=(3, 10))
             if response.status_code == 200:
-                no_of_store_data = response.json()
+                no_of_store_data = _parse_json(response)
                 if 'number_stores' in no_of_store_data:
                     return no_of_store_data['number_stores']
                 else:
@@ -127,6 +197,33 @@ class DataExtractor:
             return None 
 
     
+    def _fetch_store_record(self, base_endpoint, headers, store_number):
+        """
+        Fetch a single store's record from the web service.
+
+        Args:
+            base_endpoint (str): The base URL of the web service for store data.
+            headers (dict): Headers to include in the HTTP request.
+            store_number (int): The store number to fetch.
+
+        Returns:
+            The store's JSON dict tagged with its store number, or None if the request fails.
+        """
+        store_endpoint = f'{base_endpoint}{store_number}'
+        try:
+            response = self._session.get(store_endpoint, headers=headers, timeout=(3, 10))
+
+            if response.status_code == 200:
+                data = _parse_json(response)
+                data['_store_number'] = store_number
+                return data
+            log.warning('Failed to retrieve data for store %s (status %s)',
+                        store_number, response.status_code)
+        except Exception as e:
+            log.warning('Failed to retrieve data for store %s: %s', store_number, e)
+        return None
+
+
     def _retrieve_stores_data(self, base_endpoint, headers, total_stores=TOTAL_STORES):
         """
         Retrieve data for multiple stores from a web service and return it as a Pandas DataFrame.
@@ -139,30 +236,87 @@ class DataExtractor:
         Returns:
             Pandas DataFrame containing the data for all stores.
         """
-        all_stores_data = pd.DataFrame()
-
-        for store_number in range(0, total_stores + 1):
-            store_endpoint = f'{base_endpoint}{store_number}'
-            try:
-                response = requests.get(store_endpoint, headers=headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    store_data = pd.DataFrame(data, index=[store_number])
-                    
-                    if any(store_data.columns.str.contains(' ')):
-                        print(f'Warning: Found spaces in column names for store {store_number}. Data might be inconsistent.')
-                    
-                    all_stores_data = pd.concat([all_stores_data, store_data])
-                else:
-                    print(f'Failed to retrieve data for store {store_number}')
-            except Exception as e:
-                print(f'Error: {e}')
-                print(f'Failed to retrieve data for store {store_number}')
+        # The 450+ store requests are independent network waits, so issue them
+        # concurrently over the pooled session instead of paying one round
+        # trip after another; worker count stays within the adapter pool size.
+        store_numbers = range(0, total_stores + 1)
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = executor.map(
+                lambda store_number: self._fetch_store_record(base_endpoint, headers, store_number),
+                store_numbers)
+        store_records = [record for record in results if record is not None]
+        # One summary line instead of per-store stdout writes; the workers log
+        # individual failures at WARNING without contending for stdout.
+        log.info('Fetched %d/%d stores (%d failed)', len(store_records),
+                 total_stores + 1, total_stores + 1 - len(store_records))
+
+        if not store_records:
+            return pd.DataFrame()
+
+        # Assemble columns directly: pre-sized lists filled by position skip
+        # the per-record key union and row-to-column pivot that from_records
+        # performs over a list of dicts, leaving a single DataFrame wrap.
+        row_count = len(store_records)
+        columns = {}
+        for position, record in enumerate(store_records):
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * row_count
+                column[position] = value
+
+        all_stores_data = pd.DataFrame(columns).set_index('_store_number')
+        all_stores_data.index.name = None
+
+        # Narrow the coordinate columns at the source: float32 is plenty for
+        # lat/long precision and halves their footprint through cleaning.
+        # staff_numbers stays text because cleaning recovers digits from
+        # mistyped values like 'J78'.
+        for column in ('longitude', 'latitude', 'lat'):
+            if column in all_stores_data.columns:
+                all_stores_data[column] = pd.to_numeric(
+                    all_stores_data[column], errors='coerce').astype('float32')
+
+        if any(' ' in column for column in all_stores_data.columns):
+            print('Warning: Found spaces in store column names. Data might be inconsistent.')
 
         return all_stores_data
     
 
+    def _fetch_s3_object(self, s3, s3_bucket, s3_object):
+        """
+        Fetch an S3 object's payload as a binary file-like object.
+
+        Objects no larger than one range window stream straight from the GET
+        response; larger ones are split into 16 MB ranged GETs downloaded in
+        parallel so fetch latency overlaps across the ranges.
+
+        Args:
+            s3 (botocore.client.S3): The S3 client to fetch with.
+            s3_bucket (str): Name of the S3 bucket.
+            s3_object (str): Key of the object within the bucket.
+
+        Returns:
+            A binary file-like object containing the payload.
+        """
+        content_length = s3.head_object(Bucket=s3_bucket, Key=s3_object)['ContentLength']
+        if content_length <= self.S3_RANGE_WINDOW:
+            return s3.get_object(Bucket=s3_bucket, Key=s3_object)['Body']
+
+        byte_ranges = [(start, min(start + self.S3_RANGE_WINDOW, content_length) - 1)
+                       for start in range(0, content_length, self.S3_RANGE_WINDOW)]
+
+        def fetch_range(byte_range):
+            start, end = byte_range
+            response = s3.get_object(Bucket=s3_bucket, Key=s3_object,
+                                     Range=f'bytes={start}-{end}')
+            return response['Body'].read()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parts = list(executor.map(fetch_range, byte_ranges))
+        return io.BytesIO(b''.join(parts))
+
+
     def _extract_csv_from_s3(self, s3_address):
         """
         Extract data from a CSV file from an Amazon S3 bucket and return it as a Pandas DataFrame.
@@ -173,15 +327,20 @@ class DataExtractor:
         Returns:
             Pandas DataFrame containing the extracted data, or None if extraction fails.
         """
-        s3 = boto3.client('s3')
-
         try:
             s3_bucket = s3_address.split('/')[2]
             s3_object = '/'.join(s3_address.split('/')[3:])
-            response = s3.get_object(Bucket=s3_bucket, Key=s3_object)
-            data = response['Body'].read().decode('utf-8')
-
-            s3_df = pd.read_csv(StringIO(data))
+            body = self._fetch_s3_object(self._s3, s3_bucket, s3_object)
+
+            # The body is file-like, so the C parser can consume it directly
+            # without decoding the payload into a Python string first.
+            # Literal 'NULL' strings become NaN during tokenisation for free.
+            # Objects stored as .gz inflate in pandas' zlib path; compression
+            # has to be spelled out because a buffer has no filename to infer
+            # it from.
+            compression = 'gzip' if s3_object.endswith('.gz') else None
+            s3_df = pd.read_csv(body, na_values=['NULL'], keep_default_na=True,
+                                compression=compression)
             return s3_df
         except Exception as e:
             print(f'Error extracting data from S3: {str(e)}')
@@ -198,17 +357,14 @@ class DataExtractor:
         Returns:
             Pandas DataFrame containing the extracted data, or None if extraction fails.
         """
-        s3 = boto3.client('s3')
-
         try:
             s3_bucket = s3_address.split('/')[2]
             s3_object = '/'.join(s3_address.split('/')[3:])
-            response = s3.get_object(Bucket=s3_bucket, Key=s3_object)
-            data = response['Body'].read().decode('utf-8')
-
-            json_data = json.loads(data)
+            body = self._fetch_s3_object(self._s3, s3_bucket, s3_object)
 
-            s3_df = pd.DataFrame(json_data)
+            # Parse straight from the binary body rather than decoding to a
+            # string and building the DataFrame from parsed Python objects.
+            s3_df = pd.read_json(body)
 
             return s3_df
         except Exception as e:
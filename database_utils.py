@@ -1,3 +1,6 @@
+import functools
+import io
+
 from sqlalchemy import create_engine
 import yaml
 
@@ -24,6 +27,9 @@ class DataBaseConnector:
         _init_local_db_engine(self) -> sqlalchemy.engine.base.Connection:
             Initialises a SQLAlchemy database engine for a local database with retrieved credentials.
 
+        _local_engine -> sqlalchemy.engine.base.Connection:
+            Cached local database engine shared by every upload.
+
         _upload_to_db(self, df: pandas.DataFrame, table_name: str):
             Uploads a cleaned Pandas DataFrame to a PostgreSQL database table, replacing the existing data.
 
@@ -33,13 +39,18 @@ class DataBaseConnector:
         """
         Read in the db_creds YAML file and output as a dictionary.
 
+        The parsed credentials are cached on the instance so each engine
+        initialisation after the first skips the file read and YAML parse;
+        libyaml's C loader is used when the binding is installed.
+
         Returns:
             dict: A dictionary containing database credentials.
         """
-        with open("db_creds.yaml", "r") as file:
-            db_creds = yaml.safe_load(file)
+        if getattr(self, '_db_creds', None) is None:
+            with open("db_creds.yaml", "r") as file:
+                self._db_creds = yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
-        return db_creds
+        return self._db_creds
     
     
     def _read_headers(self):
@@ -82,6 +93,17 @@ class DataBaseConnector:
         return engine
     
 
+    @functools.cached_property
+    def _local_engine(self):
+        """
+        The local database engine, built on first use and reused thereafter.
+
+        Returns:
+            sqlalchemy.engine.base.Connection: The cached local database engine.
+        """
+        return self._init_local_db_engine()
+
+
     def _upload_to_db(self, df, table_name):
         """
         Upload a Pandas DataFrame to a PostgreSQL database table, replacing existing data.
@@ -94,11 +116,31 @@ class DataBaseConnector:
             None
         """
         try:
-            local_engine = self._init_local_db_engine()
-            df.to_sql(table_name, local_engine, if_exists='replace', index=False)
+            local_engine = self._local_engine
+            try:
+                # to_sql only creates/replaces the empty table; the rows go in
+                # through COPY, which bypasses per-row INSERT parsing and is
+                # the bulk-load path Postgres optimises for.
+                df.head(0).to_sql(table_name, local_engine, if_exists='replace', index=False)
+                quoted_table = local_engine.dialect.identifier_preparer.quote(table_name)
+                buffer = io.StringIO()
+                df.to_csv(buffer, index=False, header=False)
+                buffer.seek(0)
+                raw_connection = local_engine.raw_connection()
+                try:
+                    with raw_connection.cursor() as cursor:
+                        cursor.copy_expert(f'COPY {quoted_table} FROM STDIN WITH CSV', buffer)
+                    raw_connection.commit()
+                finally:
+                    raw_connection.close()
+            except Exception as copy_error:
+                # COPY needs a psycopg2 cursor; fall back to plain to_sql on
+                # anything else (or if the bulk load itself fails).
+                print(f"COPY upload failed ({str(copy_error)}); falling back to to_sql")
+                df.to_sql(table_name, local_engine, if_exists='replace', index=False)
             print(f"Uploaded DataFrame to table: {table_name}")
         except Exception as e:
-            print(f"An error occurred while uploading the DataFrame to the local database: {str(e)}") 
+            print(f"An error occurred while uploading the DataFrame to the local database: {str(e)}")
 
 
         
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from data_cleaning import DataCleaning
 from database_utils import DataBaseConnector
 from data_extraction import DataExtractor
@@ -91,10 +93,19 @@ class DataHandlingMain:
 if __name__ == "__main__":
     data_handler = DataHandlingMain()
 
-    data_handler.extract_and_upload_user_data()
-    data_handler.extract_and_upload_card_data()
-    data_handler.extract_and_upload_store_data()
-    data_handler.extract_and_upload_product_data()
-    data_handler.extract_and_upload_orders_data()
-    data_handler.extract_and_upload_date_events_data()
+    # The six pipelines read from different sources and write to different
+    # destination tables, so their I/O waits can overlap; the shared SQLAlchemy
+    # engine is thread-safe and each pipeline gets its own connection from it.
+    pipelines = [
+        data_handler.extract_and_upload_user_data,
+        data_handler.extract_and_upload_card_data,
+        data_handler.extract_and_upload_store_data,
+        data_handler.extract_and_upload_product_data,
+        data_handler.extract_and_upload_orders_data,
+        data_handler.extract_and_upload_date_events_data,
+    ]
+    with ThreadPoolExecutor(max_workers=len(pipelines)) as executor:
+        futures = [executor.submit(pipeline) for pipeline in pipelines]
+        for future in futures:
+            future.result()
 